@@ -1,9 +1,17 @@
 from __future__ import print_function
+import functools
 import os
 import re
 import requests
 import logging
-from bs4 import BeautifulSoup, NavigableString
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+try:
+    import orjson as json
+except ImportError:  # orjson is optional; the stdlib parser is just slower
+    import json
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from urllib.parse import urlparse
 from datetime import datetime
 
@@ -14,18 +22,45 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 BASE_OUTPUT_DIR = os.getenv('BASE_OUTPUT_DIR', os.path.join(os.getcwd(), 'output'))
 logging.debug(f"BASE_OUTPUT_DIR: {BASE_OUTPUT_DIR}")
 
+# Regex patterns used on every text node, compiled once at import
+# Social sharing labels run first: their trailing \s* can remove a newline
+# that would otherwise stop the audio notice pattern's .* from matching
+_RE_SOCIAL = re.compile(r'(?:Share this post|Copy link|Facebook|Email|Notes|More)\s*')
+# Audio player notice and player time readout, in one pass
+_RE_PLAYER = re.compile(
+    r'(?P<audio>Audio playback is not supported.*upgrade\.)'
+    r'|(?P<time>\d+:\d+:\d+Current time:.*?Total time:.*?\d+:\d+:\d+)'
+)
+_RE_BLANKLINES = re.compile(r'\n\s*\n')
+
+# Subtrees dropped before conversion: scripts, styles, JSON-LD and share/player chrome
+_SKIP_SELECTOR = 'script, style, [type="application/ld+json"], .share-button, .social-links, .player-controls'
+_SKIP_CLASSES = frozenset({'share-button', 'social-links', 'player-controls'})
+
+# Muddled transcript detection and cleanup
+_RE_LONG_RUN = re.compile(r'\w{30,}')
+_RE_SENTENCE_GAP = re.compile(r'\. [A-Z]')
+_RE_PRICE = re.compile(r'\d+(?:[kKmM]|\s*dollars?|\s*bucks?)')
+_RE_CASE_CHANGE = re.compile(r'([a-z])([A-Z])')
+_PUNCTUATION = frozenset('.,!?')
+
+# Translate table for muddled transcripts: strip non-ASCII (BMP) characters,
+# except the prime mark that stands in for an apostrophe
+_STRIP_NON_ASCII = dict.fromkeys(range(0x80, 0x10000))
+_STRIP_NON_ASCII[ord('′')] = "'"
+
 def is_muddled_transcript(text):
     """Detect if text is likely a muddled transcript section."""
     if not text or len(text) < 200:  # Lower threshold to catch smaller blocks
         return False
     
     # Look for classic signs of transcript mangling
-    has_unicode = any(ord(c) > 127 for c in text)
-    has_runs = bool(re.search(r'\w{30,}', text))  # Long runs of text without spaces
-    has_weird_spaces = '.' in text and not bool(re.search(r'\. [A-Z]', text))  # Missing sentence spacing
+    has_unicode = not text.isascii()
+    has_runs = bool(_RE_LONG_RUN.search(text))  # Long runs of text without spaces
+    has_weird_spaces = '.' in text and not bool(_RE_SENTENCE_GAP.search(text))  # Missing sentence spacing
     
     # Look for price/number patterns that often get mangled
-    has_price_numbers = bool(re.search(r'\d+(?:[kKmM]|\s*dollars?|\s*bucks?)', text)) 
+    has_price_numbers = bool(_RE_PRICE.search(text)) 
     
     return (has_unicode or has_runs or (has_weird_spaces and has_price_numbers))
 
@@ -35,47 +70,117 @@ def clean_muddled_text(text):
         return text
     
     # Handle unicode chars that often get mangled
-    text = text.replace('′', "'")  # Smart quotes
-    text = re.sub(r'[\u0080-\uffff]', '', text)  # Remove other unicode
+    text = text.translate(_STRIP_NON_ASCII)  # Smart quotes, remove other unicode
     
     # Fix runs of text without spaces
-    text = re.sub(r'([a-z])([A-Z])', r'\1. \2', text)  # Add periods between sentence case changes
-    text = re.sub(r'([.!?])([A-Za-z])', r'\1 \2', text)  # Add space after punctuation
+    text = _RE_CASE_CHANGE.sub(r'\1. \2', text)  # Add periods between sentence case changes
     
     # Clean up repeated fragments (common in transcript mangling)
-    fragments = text.split('.')
-    seen = set()
-    unique = []
-    for f in fragments:
-        f = f.strip()
-        if f and f not in seen:
-            seen.add(f)
-            unique.append(f)
+    # dict.fromkeys keeps first-seen order while dropping repeats
+    unique = dict.fromkeys(f.strip() for f in text.split('.'))
+    unique.pop('', None)
     text = '. '.join(unique)
     
     # Final cleanup
-    text = re.sub(r'\s+', ' ', text)  # Normalize spaces
-    text = re.sub(r'\s*([.,!?])\s*', r'\1 ', text)  # Fix punctuation spacing
-    text = re.sub(r'[.,!?]\s+(?=[.,!?])', '', text)  # Remove redundant punctuation
+    return _normalize_punct(text)
+
+def _normalize_punct_bytes(buf, out):
+    """_normalize_punct over UTF-8 bytes for numba; returns the output length."""
+    n = 0
+    prev_was_punct = False
+    prev_was_space = False
+    for c in buf:
+        # ASCII whitespace as str.isspace() sees it: \t-\r, \x1c-\x1f and space
+        if (9 <= c <= 13) or (28 <= c <= 32):
+            prev_was_space = True
+        elif c == 46 or c == 44 or c == 33 or c == 63:  # . , ! ?
+            if prev_was_punct:
+                out[n - 1] = c
+            else:
+                out[n] = c
+                n += 1
+            prev_was_punct = True
+            prev_was_space = False
+        else:
+            if prev_was_punct or (prev_was_space and n > 0):
+                out[n] = 32
+                n += 1
+            out[n] = c
+            n += 1
+            prev_was_punct = False
+            prev_was_space = False
+    return n
+
+@functools.lru_cache(maxsize=None)
+def _load_normalize_punct_jit():
+    """Import numba and compile _normalize_punct_bytes on first use.
+
+    Deferred so plain conversions don't pay numba's import cost; returns
+    (numpy, kernel), or None when numba is not installed.
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:  # numba is optional; transcripts fall back to pure Python
+        return None
+    return np, njit(cache=True)(_normalize_punct_bytes)
+
+def _normalize_punct(text):
+    """Normalize spaces and punctuation spacing in one forward pass.
+
+    Runs of whitespace collapse to a single space, punctuation is followed
+    by exactly one space, and a run of punctuation keeps only its last mark.
+    Uses the numba-compiled byte loop when available; callers pass text that
+    has already had U+0080-U+FFFF stripped, so only ASCII whitespace remains.
+    """
+    jit = _load_normalize_punct_jit()
+    if jit is not None:
+        np, kernel = jit
+        buf = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+        # A space can follow each punctuation mark, so output is at most twice as long
+        out = np.empty(2 * len(buf), dtype=np.uint8)
+        n = kernel(buf, out)
+        return out[:n].tobytes().decode('utf-8')
     
-    return text.strip()
+    out = []
+    prev_was_punct = False
+    prev_was_space = False
+    for c in text:
+        if c.isspace():
+            prev_was_space = True
+        elif c in _PUNCTUATION:
+            # Redundant punctuation: the later mark replaces the earlier one
+            if prev_was_punct:
+                out[-1] = c
+            else:
+                out.append(c)
+            prev_was_punct = True
+            prev_was_space = False
+        else:
+            if prev_was_punct or (prev_was_space and out):
+                out.append(' ')
+            out.append(c)
+            prev_was_punct = False
+            prev_was_space = False
+    return ''.join(out)
 
 def clean_text(text, clean_transcripts=False):
     """Clean up text by removing unwanted UI elements and formatting."""
     if not text:
         return ''
+    return _clean_text_cached(str(text), clean_transcripts)
+
+@functools.lru_cache(maxsize=4096)
+def _clean_text_cached(text, clean_transcripts):
+    """Memoized body of clean_text; boilerplate strings repeat across a page."""
     # Remove social media related text
-    text = re.sub(r'(?:Share this post|Copy link|Facebook|Email|Notes|More)\s*', '', text)
+    text = _RE_SOCIAL.sub('', text)
     
-    # Remove audio player text
-    text = re.sub(r'Audio playback is not supported.*upgrade\.', '', text)
-    
-    # Remove current time/total time text
-    text = re.sub(r'\d+:\d+:\d+Current time:.*?Total time:.*?\d+:\d+:\d+', '', text)
+    # Remove audio player and current time/total time text
+    text = _RE_PLAYER.sub('', text)
     
     # Clean up extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
+    text = ' '.join(text.split())
     
     # If this looks like a muddled transcript and cleaning is enabled, clean it up
     if clean_transcripts and is_muddled_transcript(text):
@@ -83,103 +188,282 @@ def clean_text(text, clean_transcripts=False):
         
     return text
 
-def should_skip_element(tag):
+def should_skip_element(node):
     """Determine if an element should be skipped in the conversion."""
     # Skip script and style tags
-    if tag.name in ['script', 'style']:
+    if node.tag in ['script', 'style']:
         return True
     
     # Skip JSON-LD content
-    if tag.get('type') == 'application/ld+json':
+    if node.attributes.get('type') == 'application/ld+json':
         return True
         
     # Skip social sharing buttons and UI elements
-    classes = tag.get('class', [])
-    if any(c in str(classes) for c in ['share-button', 'social-links', 'player-controls']):
+    classes = node.attributes.get('class')
+    if classes and not _SKIP_CLASSES.isdisjoint(classes.split()):
         return True
         
     # Skip elements with social media related text
-    text = tag.get_text(strip=True)
+    text = node.text(strip=True)
     if text and text in ['Share this post', 'FacebookEmailNotesMore']:
         return True
         
     return False
 
-def html_to_markdown(html_content, clean_transcripts=False):
-    soup = BeautifulSoup(html_content, 'html.parser')
+# schema.org types whose JSON-LD articleBody can stand in for the page
+_JSON_LD_ARTICLE_TYPES = frozenset({'Article', 'NewsArticle', 'BlogPosting', 'Report', 'TechArticle'})
+
+def _find_json_ld_article(tree):
+    """Return the first JSON-LD article object with a non-empty articleBody."""
+    for script in tree.css('script[type="application/ld+json"]'):
+        try:
+            data = json.loads(script.text(deep=True))
+        except ValueError:
+            continue
+        
+        # Objects may be top-level, in a list, or nested under @graph
+        candidates = data if isinstance(data, list) else [data]
+        for candidate in list(candidates):
+            if isinstance(candidate, dict) and isinstance(candidate.get('@graph'), list):
+                candidates.extend(candidate['@graph'])
+        
+        for candidate in candidates:
+            if not isinstance(candidate, dict):
+                continue
+            types = candidate.get('@type')
+            types = types if isinstance(types, list) else [types]
+            body = candidate.get('articleBody')
+            if _JSON_LD_ARTICLE_TYPES.intersection(t for t in types if isinstance(t, str)) \
+                    and isinstance(body, str) and body.strip():
+                return candidate
+    return None
+
+def _json_ld_to_markdown(article, clean_transcripts=False):
+    """Format a JSON-LD article's headline, author and body as Markdown."""
+    parts = []
+    headline = article.get('headline') or article.get('name')
+    if isinstance(headline, str) and headline.strip():
+        parts.append(f"# {clean_text(headline)}")
     
-    # Remove unwanted elements
-    for element in soup.find_all(should_skip_element):
-        element.decompose()
+    authors = article.get('author')
+    authors = authors if isinstance(authors, list) else [authors]
+    names = [a.get('name') if isinstance(a, dict) else a for a in authors]
+    names = [name for name in names if isinstance(name, str) and name.strip()]
+    if names:
+        parts.append(f"By {', '.join(names)}")
     
-    def process_tag(tag):
-        if isinstance(tag, NavigableString):
-            return clean_text(tag.string, clean_transcripts=clean_transcripts) if tag.string else ''
+    for paragraph in article['articleBody'].split('\n'):
+        cleaned_paragraph = clean_text(paragraph, clean_transcripts=clean_transcripts)
+        if cleaned_paragraph:
+            parts.append(cleaned_paragraph)
+    return '\n\n'.join(parts)
+
+# Frame states for the iterative walk in html_to_markdown
+_ENTER, _EXIT, _ENTER_ITEM = range(3)
+
+def _push_children(stack, node):
+    """Push node's children so they are popped in document order."""
+    child = node.last_child
+    while child is not None:
+        stack.append((child, _ENTER, None, None))
+        child = child.prev
+
+def _follows_word(out, index):
+    """Check whether a '[' placed at out[index] would touch the preceding text.
+
+    Used to add a space before link brackets as they are emitted, unless
+    the previous character is whitespace, '[' or '!'.
+    """
+    if not index:
+        return False
+    last = out[index - 1][-1]
+    return not last.isspace() and last not in '[!'
+
+# Element handlers, called when the walk enters a node: handler(node, out, stack)
+
+def _handle_a(node, out, stack):
+    href = node.attributes.get('href') or ''
+    # Skip processing if href contains javascript: or void(0)
+    if 'javascript:' in href or 'void(0)' in href:
+        return
         
-        if should_skip_element(tag):
-            return ''
+    # Check if the link contains an image
+    img = node.css_first('img')
+    if img:
+        src = img.attributes.get('src') or ''
+        alt = img.attributes.get('alt') or ''
+        # Create a linked image in Markdown
+        prefix = ' ' if _follows_word(out, len(out)) else ''
+        out.append(f"{prefix}[![{alt}]({src})]({href})")
+    else:
+        if href:
+            stack.append((node, _EXIT, len(out), href))
+        _push_children(stack, node)
+
+def _handle_img(node, out, stack):
+    src = node.attributes.get('src') or ''
+    alt = node.attributes.get('alt') or ''
+    out.append(f"![{alt}]({src})")
+
+def _handle_block(node, out, stack):
+    stack.append((node, _EXIT, len(out), None))
+    _push_children(stack, node)
+
+def _handle_list(node, out, stack):
+    stack.append((node, _EXIT, len(out), None))
+    ordered = node.tag == 'ol'
+    # Push direct <li> children as they are met, then flip them into pop order
+    first = len(stack)
+    count = 0
+    for child in node.iter():
+        if child.tag == 'li':
+            count += 1
+            stack.append((child, _ENTER_ITEM, None, f"{count}." if ordered else '*'))
+    stack[first:] = reversed(stack[first:])
+
+def _handle_br(node, out, stack):
+    out.append('\n')
+
+def _handle_passthrough(node, out, stack):
+    _push_children(stack, node)
+
+# Exit handlers rewrite out[start:] once an element's children are emitted:
+# handler(node, out, start, data)
+
+def _exit_a(node, out, start, href):
+    if start == len(out):
+        # Empty link: '[](href)' is never spaced off the preceding word
+        out.append(f"[]({href})")
+        return
+    # The link owns the spacing: drop any space its first text leaf added
+    # before a literal '[' so '[1]' links don't come out as ' [ [1]'
+    if out[start].startswith(' ['):
+        out[start] = out[start][1:]
+    out.insert(start, ' [' if _follows_word(out, start) else '[')
+    out.append(f"]({href})")
+
+def _exit_heading(node, out, start, data):
+    # Text children were cleaned as leaves; only collapse whitespace so a
+    # <br> cannot split the heading across lines
+    level = int(node.tag[1])
+    content = ' '.join(''.join(out[start:]).split())
+    out[start:] = [f"\n\n{'#' * level} {content}\n\n"]
+
+def _exit_p(node, out, start, data):
+    content = ''.join(out[start:]).strip()
+    out[start:] = [f"\n\n{content}\n\n"] if content else []
+
+def _exit_list(node, out, start, data):
+    items = out[start:]
+    out[start:] = ['\n' + '\n'.join(items) + '\n'] if items else []
+
+def _exit_item(node, out, start, marker):
+    cleaned_content = clean_text(''.join(out[start:]))
+    out[start:] = [f"{marker} {cleaned_content}"] if cleaned_content else []
+
+_HANDLERS = {
+    'a': _handle_a,
+    'img': _handle_img,
+    'p': _handle_block,
+    'br': _handle_br,
+    'ul': _handle_list,
+    'ol': _handle_list,
+    'h1': _handle_block,
+    'h2': _handle_block,
+    'h3': _handle_block,
+    'h4': _handle_block,
+    'h5': _handle_block,
+    'h6': _handle_block,
+}
+
+_EXIT_HANDLERS = {
+    'a': _exit_a,
+    'p': _exit_p,
+    'ul': _exit_list,
+    'ol': _exit_list,
+    'li': _exit_item,
+    'h1': _exit_heading,
+    'h2': _exit_heading,
+    'h3': _exit_heading,
+    'h4': _exit_heading,
+    'h5': _exit_heading,
+    'h6': _exit_heading,
+}
+
+def html_to_markdown(html_content, clean_transcripts=False):
+    # Bytes are sniffed for <meta charset> and transcoded to UTF-8 once
+    tree = LexborHTMLParser(html_content, encoding=True)
+    
+    # A JSON-LD article body is the publisher's own clean copy; use it when present
+    article = _find_json_ld_article(tree)
+    if article:
+        return _json_ld_to_markdown(article, clean_transcripts=clean_transcripts)
+    
+    # Remove unwanted elements in a single selector pass before the walk
+    for node in tree.css(_SKIP_SELECTOR):
+        node.decompose()
+    
+    out = []
+    # Iterative depth-first walk: each frame is (node, state, start, data), where
+    # start is the length of out when the element was entered and data carries
+    # the link href or list item marker needed on exit
+    stack = [(tree.body or tree.root, _ENTER, 0, None)]
+    while stack:
+        node, state, start, data = stack.pop()
+        tag = node.tag
         
-        if tag.name == 'a':
-            href = tag.get('href', '')
-            # Skip processing if href contains javascript: or void(0)
-            if 'javascript:' in href or 'void(0)' in href:
-                return ''
-                
-            # Check if the link contains an image
-            img = tag.find('img')
-            if img:
-                src = img.get('src', '')
-                alt = img.get('alt', '')
-                # Create a linked image in Markdown
-                return f"[![{alt}]({src})]({href})"
-            else:
-                content = ''.join(process_tag(child) for child in tag.contents)
-                return f"[{content}]({href})" if href else content
-        elif tag.name == 'img':
-            src = tag.get('src', '')
-            alt = tag.get('alt', '')
-            return f"![{alt}]({src})"
-        elif tag.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            level = int(tag.name[1])
-            content = ''.join(process_tag(child) for child in tag.contents)
-            return f"\n\n{'#' * level} {clean_text(content)}\n\n"
-        elif tag.name == 'p':
-            content = ''.join(process_tag(child) for child in tag.contents)
-            cleaned_content = clean_text(content)
-            return f"\n\n{cleaned_content}\n\n" if cleaned_content else ''
-        elif tag.name in ['ul', 'ol']:
-            items = []
-            for i, li in enumerate(tag.find_all('li', recursive=False)):
-                marker = '*' if tag.name == 'ul' else f"{i+1}."
-                content = ''.join(process_tag(child) for child in li.contents)
-                cleaned_content = clean_text(content)
-                if cleaned_content:
-                    items.append(f"{marker} {cleaned_content}")
-            return '\n' + '\n'.join(items) + '\n' if items else ''
-        elif tag.name == 'br':
-            return '\n'
-        else:
-            return ''.join(process_tag(child) for child in tag.contents)
+        if state == _EXIT:
+            _EXIT_HANDLERS[tag](node, out, start, data)
+        elif state == _ENTER_ITEM:
+            # List items exit through _exit_item with their marker
+            stack.append((node, _EXIT, len(out), data))
+            _push_children(stack, node)
+        elif tag == '-text':
+            text = node.text(deep=False)
+            if text:
+                cleaned_text = clean_text(text, clean_transcripts=clean_transcripts)
+                if cleaned_text:
+                    if cleaned_text[0] == '[' and not cleaned_text.startswith('[]') and _follows_word(out, len(out)):
+                        cleaned_text = ' ' + cleaned_text
+                    out.append(cleaned_text)
+        # Comments, doctype and other non-element nodes carry no content
+        elif not tag.startswith('-') and not should_skip_element(node):
+            _HANDLERS.get(tag, _handle_passthrough)(node, out, stack)
 
-    markdown_content = process_tag(soup.body or soup)
+    markdown_content = ''.join(out)
     
     # Clean up extra whitespace
-    markdown_content = re.sub(r'\n\s*\n', '\n\n', markdown_content)
+    markdown_content = _RE_BLANKLINES.sub('\n\n', markdown_content)
     markdown_content = markdown_content.strip()
 
-    # Add space before [ if it's not a markdown link/image and no space exists
-    markdown_content = re.sub(r'([^\s\[!])\[(?!\])', r'\1 [', markdown_content)
-
     return markdown_content
 
+# Shared session so repeated downloads reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'web2md (+https://github.com/robotdad/web2md)'})
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
 def download_content(url):
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=(5, 30))
         response.raise_for_status()
         content_type = response.headers.get('content-type', '').split(';')[0].lower()
 
         if 'text/html' in content_type:
-            return response.text
+            # A charset in the Content-Type header wins; without one, hand raw
+            # bytes to the parser, which checks the BOM and <meta charset>
+            if 'charset=' in response.headers.get('content-type', '').lower():
+                try:
+                    return response.content.decode(response.encoding, 'replace')
+                except LookupError:
+                    logging.warning(f"Unknown charset {response.encoding!r} for {url}")
+            return response.content
         else:
             logging.error(f"Unsupported content-type: {content_type}")
             return None
@@ -187,8 +471,14 @@ def download_content(url):
         logging.error(f"Failed to download content from {url}: {e}")
         return None
 
+# Output directories already created during this run
+_CREATED_DIRS = set()
+
 def save_markdown(content, filename):
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    output_dir = os.path.dirname(filename)
+    if output_dir not in _CREATED_DIRS:
+        os.makedirs(output_dir, exist_ok=True)
+        _CREATED_DIRS.add(output_dir)
     with open(filename, 'w', encoding='utf-8') as file:
         file.write(content)
 
@@ -199,6 +489,7 @@ def url_to_markdown(url, clean_transcripts=False):
         return markdown_content
     return None
 
+@functools.lru_cache(maxsize=1024)
 def get_output_filename(url, output_dir):
     """Determine the output filename based on the URL."""
     url_parts = urlparse(url)
@@ -212,11 +503,14 @@ def get_output_filename(url, output_dir):
     
     return os.path.join(output_dir, filename)
 
-def main(url, clean_transcripts=False):
-    url_parts = urlparse(url)
-    domain = url_parts.netloc
+def get_output_dir(url):
+    """Determine the dated, per-domain output directory for a URL."""
+    domain = urlparse(url).netloc
     date_dir = datetime.now().strftime('%Y-%m-%d')
-    output_dir = os.path.join(BASE_OUTPUT_DIR, date_dir, domain)
+    return os.path.join(BASE_OUTPUT_DIR, date_dir, domain)
+
+def main(url, clean_transcripts=False):
+    output_dir = get_output_dir(url)
 
     markdown_content = url_to_markdown(url, clean_transcripts=clean_transcripts)
     if markdown_content:
@@ -226,12 +520,69 @@ def main(url, clean_transcripts=False):
     else:
         print("Failed to convert the URL to Markdown.")
 
+def main_many(urls, clean_transcripts=False, download_workers=16, parse_workers=None):
+    """Convert a batch of URLs, overlapping downloads with parsing.
+
+    Downloads run on a thread pool; the CPU-bound HTML to Markdown
+    conversion runs on a process pool (parse_workers defaults to the CPU
+    count) as soon as each page arrives, and each result is saved as soon
+    as it is ready. A failure on one URL is logged and the batch carries on.
+    """
+    with ThreadPoolExecutor(max_workers=download_workers) as downloader, \
+            ProcessPoolExecutor(max_workers=parse_workers) as parser:
+        downloads = {downloader.submit(download_content, url): url for url in urls}
+        conversions = {}
+        pending = set(downloads)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in downloads:
+                    url = downloads.pop(future)
+                    try:
+                        html_content = future.result()
+                    except Exception as e:
+                        logging.error(f"Failed to download content from {url}: {e}")
+                        html_content = None
+                    if html_content:
+                        conversion = parser.submit(html_to_markdown, html_content, clean_transcripts=clean_transcripts)
+                        conversions[conversion] = url
+                        pending.add(conversion)
+                    else:
+                        print(f"Failed to convert {url} to Markdown.")
+                    continue
+
+                url = conversions.pop(future)
+                try:
+                    markdown_content = future.result()
+                    if not markdown_content:
+                        print(f"Failed to convert {url} to Markdown.")
+                        continue
+                    filename = get_output_filename(url, get_output_dir(url))
+                    save_markdown(markdown_content, filename)
+                except Exception as e:
+                    logging.error(f"Failed to convert {url} to Markdown: {e}")
+                    continue
+                print(f"Markdown saved to: {filename}")
+
+def read_urls_file(path):
+    """Read one URL per line, ignoring blank lines and # comments."""
+    with open(path, encoding='utf-8') as file:
+        return [line.strip() for line in file if line.strip() and not line.lstrip().startswith('#')]
+
 if __name__ == '__main__':
     import sys
+    usage = "Usage: python web2md.py <URL> [--clean-transcripts]\n       python web2md.py --urls-file <FILE> [--clean-transcripts]"
     if len(sys.argv) < 2:
-        print("Usage: python web2md.py <URL> [--clean-transcripts]")
+        print(usage)
         sys.exit(1)
 
-    input_url = sys.argv[1]
     clean_transcripts = '--clean-transcripts' in sys.argv
-    main(input_url, clean_transcripts)
\ No newline at end of file
+    if '--urls-file' in sys.argv:
+        index = sys.argv.index('--urls-file')
+        if index + 1 >= len(sys.argv):
+            print(usage)
+            sys.exit(1)
+        main_many(read_urls_file(sys.argv[index + 1]), clean_transcripts)
+    else:
+        input_url = sys.argv[1]
+        main(input_url, clean_transcripts)
\ No newline at end of file